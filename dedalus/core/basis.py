@@ -259,11 +259,13 @@ class ImplicitBasis(Basis):
         if max_terms is None:
             max_terms = self.coeff_size
         n_terms = max_term = matrix = 0
-        for p in range(max_terms):
-            if abs(coeffs[p]) >= cutoff:
-                matrix = matrix + coeffs[p]*self.Multiply(p, ncc_basis_meta, arg_basis_meta)
-                n_terms += 1
-                max_term = p
+        # Select significant terms in one vectorized pass
+        terms = np.flatnonzero(np.abs(coeffs[:max_terms]) >= cutoff).tolist()
+        for p in terms:
+            matrix = matrix + coeffs[p]*self.Multiply(p, ncc_basis_meta, arg_basis_meta)
+        if terms:
+            n_terms = len(terms)
+            max_term = terms[-1]
         return n_terms, max_term, matrix
 
 
@@ -2690,15 +2692,13 @@ class Compound(ImplicitBasis):
             max_terms = self.coeff_size
         n_terms = max_term = matrix = 0
         for index, basis in enumerate(self.subbases):
-            n_terms_i = max_term_i = 0
             subcoeffs = self.sub_cdata(coeffs, index, axis=0)
-            for p in range(min(max_terms, subcoeffs.size)):
-                if abs(subcoeffs[p]) >= cutoff:
-                    matrix = matrix + subcoeffs[p]*self.Multiply(index, p, ncc_basis_meta, arg_basis_meta)
-                    n_terms_i += 1
-                    max_term_i = p
-            n_terms = max(n_terms, n_terms_i)
-            max_term = max(max_term, max_term_i)
+            terms = np.flatnonzero(np.abs(subcoeffs[:max_terms]) >= cutoff).tolist()
+            for p in terms:
+                matrix = matrix + subcoeffs[p]*self.Multiply(index, p, ncc_basis_meta, arg_basis_meta)
+            if terms:
+                n_terms = max(n_terms, len(terms))
+                max_term = max(max_term, terms[-1])
         return n_terms, max_term, matrix
 
     @CachedMethod
@@ -15,7 +15,8 @@ from .metadata import Metadata
 from ..libraries.fftw import fftw_wrappers as fftw
 from ..tools.config import config
 from ..tools.array import reshape_vector
-from ..tools.cache import CachedMethod
+from ..tools.cache import CachedAttribute, CachedMethod
+from ..tools.parsing import compile_expression
 from ..tools.exceptions import UndefinedParityError
 from ..tools.exceptions import SymbolicParsingError
 
@@ -99,7 +100,7 @@ class Operand:
     @staticmethod
     def parse(string, namespace, domain):
         """Build operand from a string expression."""
-        expression = eval(string, namespace)
+        expression = eval(compile_expression(string), namespace)
         return Operand.cast(expression, domain)
 
     @staticmethod
@@ -151,6 +152,11 @@ class Data(Operand):
     def has(self, *atoms):
         return (self in atoms)
 
+    @CachedAttribute
+    def _atom_ids(self):
+        """Ids of the atoms in the expression tree."""
+        return frozenset((id(self),))
+
     def expand(self, *vars):
         """Return self."""
         return self
@@ -172,6 +178,10 @@ class Data(Operand):
         else:
             return self
 
+    def strip_operator(self, op):
+        """Remove an operator from the expression tree."""
+        return self
+
     def order(self, *ops):
         return 0
 
@@ -188,6 +198,13 @@ class Data(Operand):
         else:
             return 0
 
+    def frechet_differential(self, vars, perts):
+        """Symbolically compute Frechet differential along perts."""
+        if self in vars:
+            return perts[vars.index(self)]
+        else:
+            return 0
+
 
 class Scalar(Data):
 
@@ -9,6 +9,7 @@ from .field import Operand, Data, Scalar, Array, Field
 from .metadata import Metadata
 from ..tools.general import OrderedSet
 from ..tools.cache import CachedAttribute, CachedMethod
+from ..tools.parsing import compile_expression
 
 import logging
 logger = logging.getLogger(__name__.split('.')[-1])
@@ -99,6 +100,15 @@ class Future(Operand):
         hasargs = any(arg.has(*atoms) for arg in self.args)
         return hasself or hasargs
 
+    @CachedAttribute
+    def _atom_ids(self):
+        """Ids of the atoms and operator types in the expression tree."""
+        atom_ids = {id(type(self))}
+        for arg in self.original_args:
+            if isinstance(arg, Operand):
+                atom_ids.update(arg._atom_ids)
+        return frozenset(atom_ids)
+
     def replace(self, old, new):
         """Replace an object in the expression tree."""
         if self == old:
@@ -110,6 +120,14 @@ class Future(Operand):
             args = [arg.replace(old, new) for arg in self.args]
             return self.base(*args, **self.kw)
 
+    def strip_operator(self, op):
+        """Remove an operator from the expression tree."""
+        if self.base == op:
+            return self.args[0].strip_operator(op)
+        else:
+            args = [arg.strip_operator(op) for arg in self.args]
+            return self.base(*args, **self.kw)
+
     def evaluate(self, id=None, force=True):
         """Recursively evaluate operation."""
 
@@ -232,7 +250,7 @@ class FutureField(Future):
     @staticmethod
     def parse(string, namespace, domain):
         """Build FutureField from a string expression."""
-        expression = eval(string, namespace)
+        expression = eval(compile_expression(string), namespace)
         return FutureField.cast(expression, domain)
 
     @staticmethod
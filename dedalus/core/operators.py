@@ -98,6 +98,10 @@ class FieldCopy(Operator, FutureField, metaclass=MultiClass):
         """Symbolically differentiate with respect to var."""
         return self.args[0].sym_diff(var)
 
+    def frechet_differential(self, vars, perts):
+        """Symbolically compute Frechet differential along perts."""
+        return self.args[0].frechet_differential(vars, perts)
+
     def split(self, *vars):
         return self.args[0].split(*vars)
 
@@ -236,6 +240,28 @@ class UnaryGridFunction(NonlinearOperator, Future, metaclass=MultiClass):
          np.arccos, np.arctan, np.sinh, np.cosh, np.tanh, np.arcsinh,
          np.arccosh, np.arctanh)}
     aliased = {'abs':np.absolute, 'conj':np.conjugate}
+    # Symbolic derivatives of supported ufuncs
+    derivatives = {np.absolute: lambda x: np.sign(x),
+                   np.sign: lambda x: 0,
+                   np.exp: lambda x: np.exp(x),
+                   np.exp2: lambda x: np.exp2(x) * np.log(2),
+                   np.log: lambda x: x**(-1),
+                   np.log2: lambda x: (x * np.log(2))**(-1),
+                   np.log10: lambda x: (x * np.log(10))**(-1),
+                   np.sqrt: lambda x: (1/2) * x**(-1/2),
+                   np.square: lambda x: 2*x,
+                   np.sin: lambda x: np.cos(x),
+                   np.cos: lambda x: -np.sin(x),
+                   np.tan: lambda x: np.cos(x)**(-2),
+                   np.arcsin: lambda x: (1 - x**2)**(-1/2),
+                   np.arccos: lambda x: -(1 - x**2)**(-1/2),
+                   np.arctan: lambda x: (1 + x**2)**(-1),
+                   np.sinh: lambda x: np.cosh(x),
+                   np.cosh: lambda x: np.sinh(x),
+                   np.tanh: lambda x: np.cosh(x)**(-2),
+                   np.arcsinh: lambda x: (x**2 + 1)**(-1/2),
+                   np.arccosh: lambda x: (x**2 - 1)**(-1/2),
+                   np.arctanh: lambda x: (1 - x**2)**(-1)}
     # Add ufuncs and shortcuts to parseables
     parseables.update(supported)
     parseables.update(aliased)
@@ -279,30 +305,15 @@ class UnaryGridFunction(NonlinearOperator, Future, metaclass=MultiClass):
 
     def sym_diff(self, var):
         """Symbolically differentiate with respect to var."""
-        diffmap = {np.absolute: lambda x: np.sign(x),
-                   np.sign: lambda x: 0,
-                   np.exp: lambda x: np.exp(x),
-                   np.exp2: lambda x: np.exp2(x) * np.log(2),
-                   np.log: lambda x: x**(-1),
-                   np.log2: lambda x: (x * np.log(2))**(-1),
-                   np.log10: lambda x: (x * np.log(10))**(-1),
-                   np.sqrt: lambda x: (1/2) * x**(-1/2),
-                   np.square: lambda x: 2*x,
-                   np.sin: lambda x: np.cos(x),
-                   np.cos: lambda x: -np.sin(x),
-                   np.tan: lambda x: np.cos(x)**(-2),
-                   np.arcsin: lambda x: (1 - x**2)**(-1/2),
-                   np.arccos: lambda x: -(1 - x**2)**(-1/2),
-                   np.arctan: lambda x: (1 + x**2)**(-1),
-                   np.sinh: lambda x: np.cosh(x),
-                   np.cosh: lambda x: np.sinh(x),
-                   np.tanh: lambda x: np.cosh(x)**(-2),
-                   np.arcsinh: lambda x: (x**2 + 1)**(-1/2),
-                   np.arccosh: lambda x: (x**2 - 1)**(-1/2),
-                   np.arctanh: lambda x: (1 - x**2)**(-1)}
         arg0 = self.args[0]
         diff0 = arg0.sym_diff(var)
-        return diffmap[self.func](arg0) * diff0
+        return self.derivatives[self.func](arg0) * diff0
+
+    def frechet_differential(self, vars, perts):
+        """Symbolically compute Frechet differential along perts."""
+        arg0 = self.args[0]
+        diff0 = arg0.frechet_differential(vars, perts)
+        return self.derivatives[self.func](arg0) * diff0
 
 
 class UnaryGridFunctionScalar(UnaryGridFunction, FutureScalar):
@@ -454,6 +465,13 @@ class Add(Arithmetic, metaclass=MultiClass):
         diff1 = arg1.sym_diff(var)
         return diff0 + diff1
 
+    def frechet_differential(self, vars, perts):
+        """Symbolically compute Frechet differential along perts."""
+        arg0, arg1 = self.args
+        diff0 = arg0.frechet_differential(vars, perts)
+        diff1 = arg1.frechet_differential(vars, perts)
+        return diff0 + diff1
+
 
 class AddScalarScalar(Add, FutureScalar):
 
@@ -729,6 +747,13 @@ class Multiply(Arithmetic, metaclass=MultiClass):
         diff1 = arg1.sym_diff(var)
         return diff0*arg1 + arg0*diff1
 
+    def frechet_differential(self, vars, perts):
+        """Symbolically compute Frechet differential along perts."""
+        arg0, arg1 = self.args
+        diff0 = arg0.frechet_differential(vars, perts)
+        diff1 = arg1.frechet_differential(vars, perts)
+        return diff0*arg1 + arg0*diff1
+
 
 class MultiplyScalarScalar(Multiply, FutureScalar):
 
@@ -987,6 +1012,12 @@ class PowerDataScalar(Power):
         diff0 = arg0.sym_diff(var)
         return arg1 * arg0**(arg1-1) * diff0
 
+    def frechet_differential(self, vars, perts):
+        """Symbolically compute Frechet differential along perts."""
+        arg0, arg1 = self.args
+        diff0 = arg0.frechet_differential(vars, perts)
+        return arg1 * arg0**(arg1-1) * diff0
+
 
 class PowerScalarScalar(PowerDataScalar, FutureScalar):
 
@@ -1087,6 +1118,11 @@ class LinearOperator(Operator):
         diff0 = self.args[0].sym_diff(var)
         return self.base(diff0, **self.kw)
 
+    def frechet_differential(self, vars, perts):
+        """Symbolically compute Frechet differential along perts."""
+        diff0 = self.args[0].frechet_differential(vars, perts)
+        return self.base(diff0, **self.kw)
+
 
 class TimeDerivative(LinearOperator, FutureField, metaclass=SkipDispatch):
 
@@ -56,7 +56,7 @@ def build_matrices(pencils, problem, matrices):
     # Build test operator dicts to synchronously expand all NCCs
     for eq in problem.eqs:
         for matrix in matrices:
-            expr, vars = eq[matrix]
+            expr, vars = getattr(eq, matrix)
             if expr != 0:
                 test_index = [0] * problem.domain.dim
                 expr.operator_dict(test_index, vars, cacheid=cacheid, **problem.ncc_kw)
@@ -136,7 +136,7 @@ class Pencil:
             index_dict['n'+basis.name] = index[axis]
 
         # Find applicable equations
-        selected_eqs = [eq for eq in problem.eqs if eval(eq['raw_condition'], index_dict)]
+        selected_eqs = [eq for eq in problem.eqs if eval(eq.raw_condition, index_dict)]
         # Check selections
         nvars = problem.nvars
         neqs = len(selected_eqs)
@@ -152,7 +152,7 @@ class Pencil:
             j = problem.eqs.index(eq)
             matrices['select'][i,j] = 1
             for name in names:
-                expr, vars = eq[name]
+                expr, vars = getattr(eq, name)
                 if expr != 0:
                     op_dict = expr.operator_dict(index, vars, cacheid=cacheid, **problem.ncc_kw)
                     matrix = matrices[name]
@@ -175,16 +175,16 @@ class Pencil:
         for axis, basis in enumerate(self.domain.bases):
             if basis.separable:
                 index_dict['n'+basis.name] = global_index[axis]
-        pencil_eqs = [eq for eq in problem.eqs if eval(eq['raw_condition'], index_dict)]
+        pencil_eqs = [eq for eq in problem.eqs if eval(eq.raw_condition, index_dict)]
 
         # Check basic solvability conditions
         n_vars = problem.nvars
         n_const_vars = sum(problem.meta[var][zname]['constant'] for var in problem.variables)
         n_nonconst_vars = n_vars - n_const_vars
         n_eqs = len(pencil_eqs)
-        n_const_eqs = sum(eq['constant'] for eq in pencil_eqs)
+        n_const_eqs = sum(eq.constant for eq in pencil_eqs)
         n_nonconst_eqs = n_eqs - n_const_eqs
-        n_tau = sum(eq['tau'] for eq in pencil_eqs)
+        n_tau = sum(eq.tau for eq in pencil_eqs)
         if n_nonconst_eqs != n_nonconst_vars:
             raise ValueError("Pencil {} has {} non-constant equations for {} non-constant variables.".format(global_index, n_nonconst_eqs, n_nonconst_vars))
         if n_const_eqs != n_const_vars + n_tau:
@@ -237,13 +237,13 @@ class Pencil:
                 continue
 
             # Build left preconditioner block
-            if eq['LHS'].meta[zbasis.name]['constant']:
+            if eq.LHS.meta[zbasis.name]['constant']:
                 PL = zbasis.DropNonfirst
-            elif eq['tau'] and eq['differential']:
-                PL = zbasis.PreconditionDropTau(eq['tau'])
-            elif eq['tau']:
-                PL = zbasis.DropTau(eq['tau'])
-            elif eq['differential']:
+            elif eq.tau and eq.differential:
+                PL = zbasis.PreconditionDropTau(eq.tau)
+            elif eq.tau:
+                PL = zbasis.DropTau(eq.tau)
+            elif eq.differential:
                 PL = zbasis.PreconditionDropMatch
             else:
                 PL = zbasis.DropMatch
@@ -254,7 +254,7 @@ class Pencil:
             PL_Zero_coo = sparse.coo_matrix(PL.shape, dtype=zdtype)
             PL_coo = PL.tocoo()
             for name in names:
-                eq_expr, eq_vars = eq[name]
+                eq_expr, eq_vars = getattr(eq, name)
                 if eq_expr != 0:
                     Ei = eq_expr.operator_dict(global_index, eq_vars, cacheid=cacheid, **problem.ncc_kw)
                 else:
@@ -367,13 +367,13 @@ def left_permutation(zbasis, n_vars, eqs):
         for subbasis in zbasis.subbases:
             L2 = []
             # Determine number of coefficients
-            if eq['LHS'].meta[zbasis.name]['constant']:
+            if eq.LHS.meta[zbasis.name]['constant']:
                 if (subbasis is zbasis.subbases[0]):
                     coeff_size = 1
                 else:
                     coeff_size = 0
             elif subbasis is zbasis.subbases[-1]:
-                coeff_size = subbasis.coeff_size - eq['tau']
+                coeff_size = subbasis.coeff_size - eq.tau
             else:
                 coeff_size = subbasis.coeff_size - 1
             # Record indeces
@@ -3,7 +3,7 @@ Classes for representing systems of equations.
 
 """
 
-from collections import OrderedDict
+import sys
 import numpy as np
 from mpi4py import MPI
 
@@ -22,7 +22,7 @@ import logging
 logger = logging.getLogger(__name__.split('.')[-1])
 
 
-class Namespace(OrderedDict):
+class Namespace(dict):
     """Class ensuring a conflict-free namespace for parsing."""
 
     __slots__ = 'allow_overwrites'
@@ -40,10 +40,20 @@ class Namespace(OrderedDict):
                 raise SymbolicParsingError("Name '{}' is not a valid identifier.".format(key))
         super().__setitem__(key, value)
 
+    def bulk_update(self, mapping):
+        """Add prevalidated entries, checking only for name conflicts."""
+        if not self.allow_overwrites:
+            conflicts = self.keys() & mapping.keys()
+            if conflicts:
+                raise SymbolicParsingError("Name '{}' is used multiple times.".format(conflicts.pop()))
+        # Base update bypasses the validating __setitem__
+        super().update(mapping)
+
     def copy(self):
         """Copy entire namespace."""
-        copy = Namespace()
-        copy.update(self)
+        # Entries are already validated, so initialize directly from self
+        copy = Namespace.__new__(Namespace)
+        dict.__init__(copy, self)
         copy.allow_overwrites = self.allow_overwrites
         return copy
 
@@ -52,14 +62,28 @@ class Namespace(OrderedDict):
         for call, result in substitutions.items():
             # Convert function calls to lambda expressions
             head, sub_str = parsing.lambdify_functions(call, result)
-            # Evaluate in current namespace
-            self[head] = sub = eval(sub_str, self)
+            # Evaluate in current namespace, reusing compiled code
+            self[head] = sub = eval(parsing.compile_expression(sub_str), self)
             # Enable output caching for expression substitutions
             # Avoids some deadlocking issues when evaluating redundant subtrees
             if isinstance(sub, future.FutureField):
                 sub.store_last = True
 
 
+class Equation:
+    """Container for the string, object, and matrix forms of an equation."""
+
+    __slots__ = ('raw_equation', 'raw_condition', 'raw_LHS', 'raw_RHS',
+                 'LHS', 'RHS', 'constant', 'differential', 'user_tau', 'tau',
+                 'linearization', 'M', 'L', 'F', 'dF', 'F_minus_L', 'finalized')
+
+    def __init__(self, equation, condition, tau):
+        self.raw_equation = equation
+        self.raw_condition = condition
+        self.user_tau = tau
+        self.finalized = False
+
+
 class ProblemBase:
     """
     Base class for problems consisting of a system of PDEs, constraints, and
@@ -80,9 +104,9 @@ class ProblemBase:
 
     Attributes
     ----------
-    parameters : OrderedDict
+    parameters : dict
         External parameters used in the equations, and held constant during integration.
-    substitutions : OrderedDict
+    substitutions : dict
         String-substitutions to be used in parsing.
 
     Notes
@@ -100,6 +124,12 @@ class ProblemBase:
     The LHS terms must be linear in the specified variables and first-order in
     coupled derivatives.
 
+    Parameters and substitutions added after the namespace has been built
+    should be set with `add_parameter` and `add_substitution`, which trigger
+    a rebuild of the namespace on its next access and a reparsing of all
+    equations when the next solver is built.  The basis and variable entries
+    are cached separately and reused across rebuilds.
+
     """
 
     def __init__(self, domain, variables, ncc_cutoff=1e-6, max_ncc_terms=None, entry_cutoff=1e-12):
@@ -108,8 +138,8 @@ class ProblemBase:
         self.nvars = len(variables)
         self.meta = MultiDict({var: Metadata(domain) for var in variables})
         self.equations = self.eqs = []
-        self.parameters = OrderedDict()
-        self.substitutions = OrderedDict()
+        self.parameters = {}
+        self.substitutions = {}
         self.ncc_kw = {'cutoff': ncc_cutoff, 'max_terms': max_ncc_terms}
         self.entry_cutoff = entry_cutoff
         self.coupled = domain.bases[-1].coupled
@@ -123,55 +153,105 @@ class ProblemBase:
         return self.nvars - self.nvars_const
 
     def add_equation(self, equation, condition="True", tau=None):
-        """Add equation to problem."""
-        logger.debug("Parsing Eqn {}".format(len(self.eqs)))
-        temp = {}
-        temp['tau'] = tau
-        self._build_basic_dictionary(temp, equation, condition)
-        self._build_object_forms(temp)
-        self._check_eqn_conditions(temp)
-        self._set_matrix_expressions(temp)
-        self.eqs.append(temp)
+        """Add equation to problem. Parsing is deferred until the solver is built."""
+        self.eqs.append(Equation(equation, condition, tau))
 
     def add_bc(self, *args, **kw):
         """Add boundary condition to problem."""
         # Deprecated. Pass to add_equation.
         return self.add_equation(*args, **kw)
 
-    def _build_basic_dictionary(self, temp, equation, condition):
-        """Split and store equation and condition strings."""
-        temp['raw_equation'] = equation
-        temp['raw_condition'] = condition
-        temp['raw_LHS'], temp['raw_RHS'] = parsing.split_equation(equation)
-        logger.debug("  Condition: {}".format(condition))
-        logger.debug("  LHS string form: {}".format(temp['raw_LHS']))
-        logger.debug("  RHS string form: {}".format(temp['raw_RHS']))
+    def _finalize_equations(self):
+        """Parse and check all pending equations."""
+        for i, temp in enumerate(self.eqs):
+            if not temp.finalized:
+                logger.debug("Parsing Eqn {}".format(i))
+                try:
+                    self._finalize_equation(temp)
+                except (SymbolicParsingError, UnsupportedEquationError) as error:
+                    # Point back to the equation string, since parsing is deferred
+                    raise type(error)("Eqn {} ({!r}): {}".format(i, temp.raw_equation, error)) from error
+                except Exception:
+                    logger.error("Failed to parse Eqn {} ({!r})".format(i, temp.raw_equation))
+                    raise
+
+    def _finalize_equation(self, temp):
+        """Build object forms and matrix expressions for an equation."""
+        self._build_string_forms(temp)
+        self._build_object_forms(temp)
+        self._check_eqn_conditions(temp)
+        self._set_matrix_expressions(temp)
+        temp.finalized = True
+
+    def _build_string_forms(self, temp):
+        """Split and store equation strings."""
+        temp.raw_LHS, temp.raw_RHS = parsing.split_equation(temp.raw_equation)
+        logger.debug("  Condition: {}".format(temp.raw_condition))
+        logger.debug("  LHS string form: {}".format(temp.raw_LHS))
+        logger.debug("  RHS string form: {}".format(temp.raw_RHS))
 
     def _build_object_forms(self, temp):
         """Parse raw LHS/RHS strings to object forms."""
-        temp['LHS'] = field.Operand.parse(temp['raw_LHS'], self.namespace, self.domain)
-        temp['RHS'] = future.FutureField.parse(temp['raw_RHS'], self.namespace, self.domain)
-        temp['constant'] = temp['LHS'].meta[-1]['constant']
-        logger.debug("  LHS object form: {}".format(temp['LHS']))
-        logger.debug("  RHS object form: {}".format(temp['RHS']))
+        temp.LHS = field.Operand.parse(temp.raw_LHS, self.namespace, self.domain)
+        temp.RHS = future.FutureField.parse(temp.raw_RHS, self.namespace, self.domain)
+        temp.constant = temp.LHS.meta[-1]['constant']
+        logger.debug("  LHS object form: {}".format(temp.LHS))
+        logger.debug("  RHS object form: {}".format(temp.RHS))
+
+    def add_parameter(self, name, value):
+        """Add parameter to problem, invalidating any cached namespace."""
+        self.parameters[name] = value
+        self._clear_namespace()
+
+    def add_substitution(self, call, result):
+        """Add substitution to problem, invalidating any cached namespace."""
+        self.substitutions[call] = result
+        self._clear_namespace()
+
+    def _clear_namespace(self):
+        """Drop cached namespace so it is rebuilt from the current parameters and substitutions."""
+        self.__dict__.pop('namespace', None)
+        # Reparse equations against the rebuilt namespace
+        for temp in self.eqs:
+            temp.finalized = False
 
     @CachedAttribute
-    def namespace(self):
-        """Build namespace for problem parsing."""
-        namespace = Namespace()
-        # Basis-specific items
+    def _basis_namespace(self):
+        """Build basis grids and operators for problem parsing."""
+        basis_namespace = Namespace()
         for axis, basis in enumerate(self.domain.bases):
             # Grids
-            namespace[basis.name] = basis.grid_array_object(self.domain, axis)
-            namespace[f's{basis.name}'] = basis.grid_spacing_object(self.domain, axis)
+            basis_namespace[basis.name] = basis.grid_array_object(self.domain, axis)
+            basis_namespace[f's{basis.name}'] = basis.grid_spacing_object(self.domain, axis)
             # Basis operators
             for op in basis.operators:
-                namespace[op.name] = op
-        # Fields
+                basis_namespace[op.name] = op
+        return basis_namespace
+
+    @CachedAttribute
+    def _variable_namespace(self):
+        """Build variable fields for problem parsing."""
+        variable_namespace = {}
         for var in self.variables:
-            namespace[var] = self.domain.new_field(name=var)
-            namespace[var].meta = self.meta[var]
-            namespace[var].set_scales(1, keep_data=False)
+            variable_namespace[var] = self.domain.new_field(name=var)
+            variable_namespace[var].meta = self.meta[var]
+            variable_namespace[var].set_scales(1, keep_data=False)
+        return variable_namespace
+
+    @CachedAttribute
+    def _var_objects(self):
+        """Variable fields, in order."""
+        return [self._variable_namespace[var] for var in self.variables]
+
+    @CachedAttribute
+    def namespace(self):
+        """Build namespace for problem parsing."""
+        namespace = Namespace()
+        # Basis-specific items
+        namespace.bulk_update(self._basis_namespace)
+        # Fields
+        for var, var_field in self._variable_namespace.items():
+            namespace[var] = var_field
         # Parameters
         for name, param in self.parameters.items():
             # Cast parameters to operands
@@ -179,9 +259,10 @@ class ProblemBase:
             casted_param.name = name
             namespace[name] = casted_param
         # Built-in functions
-        namespace.update(operators.parseables)
+        namespace.bulk_update(operators.parseables)
         # Additions from derived classes
-        namespace.update(self.namespace_additions)
+        for name, addition in self.namespace_additions.items():
+            namespace[name] = addition
         # Substitutions
         namespace.add_substitutions(self.substitutions)
 
@@ -191,19 +272,24 @@ class ProblemBase:
         """Check object-form equation conditions."""
         self._check_conditions(temp)
         self._check_differential_order(temp)
-        self._check_meta_consistency(temp['LHS'], temp['RHS'])
+        self._check_meta_consistency(temp.LHS, temp.RHS)
+
+    @CachedAttribute
+    def _coupled_diffs(self):
+        """Differentiation operators along coupled bases."""
+        return [basis.Differentiate for basis in self.domain.bases if not basis.separable]
 
     def _check_differential_order(self, temp):
         """Require LHS To be first order in coupled derivatives."""
-        coupled_diffs = [basis.Differentiate for basis in self.domain.bases if not basis.separable]
-        order = self._require_first_order(temp, 'LHS', coupled_diffs)
-        temp['differential'] = int(order)
-        if temp['constant']:
-            temp['tau'] = 0
-        elif temp['tau'] is None:
-            temp['tau'] = temp['differential']
+        order = self._require_first_order(temp, 'LHS', self._coupled_diffs)
+        temp.differential = int(order)
+        # Recompute from the user argument, since equations may be reparsed
+        if temp.constant:
+            temp.tau = 0
+        elif temp.user_tau is None:
+            temp.tau = temp.differential
         else:
-            temp['tau'] = int(temp['tau'])
+            temp.tau = int(temp.user_tau)
 
     def _check_if_zero(self, expr):
         ''' Checks if the expression is equal to zero, within a tolerance '''
@@ -233,38 +319,38 @@ class ProblemBase:
                             '(Max value: {:.3e}; below tolerance ({:.1e}) of max param: {:.3e}). '.format(max_val, self.tol, max_param))
             return True
 
+    @CachedAttribute
+    def _meta_checkers(self):
+        """Metadata consistency checks, keyed by metadata entry."""
+        return {key: getattr(self, '_check_meta_%s' %key) for key in ('constant', 'parity', 'envelope')}
+
     def _check_meta_consistency(self, LHS, RHS):
         """Check LHS and RHS metadata for compatability."""
-        self._check_meta_constant(LHS, RHS)
-        self._check_meta_parity(LHS, RHS)
-        self._check_meta_envelope(LHS, RHS)
-
-    def _check_meta_constant(self, LHS, RHS):
-        """Check that RHS is constant if LHS is consant."""
+        # Zero RHS is compatible with any LHS
+        if RHS == 0:
+            return
         for axis in range(self.domain.dim):
-            if LHS.meta[axis]['constant']:
-                if not RHS.meta[axis]['constant']:
-                    raise SymbolicParsingError("LHS is constant but RHS is nonconstant along axis {}.".format(axis))
+            LHS_meta = LHS.meta[axis]
+            RHS_meta = RHS.meta[axis]
+            for key, check in self._meta_checkers.items():
+                # Skip entries not defined along this axis
+                if key in LHS_meta:
+                    check(LHS_meta[key], RHS_meta[key], axis)
+
+    def _check_meta_constant(self, LHS_constant, RHS_constant, axis):
+        """Check that RHS is constant if LHS is consant."""
+        if LHS_constant and not RHS_constant:
+            raise SymbolicParsingError("LHS is constant but RHS is nonconstant along axis {}.".format(axis))
 
-    def _check_meta_parity(self, LHS, RHS):
-        """Check that LHS parity matches RHS parity if RHS is nonzero."""
-        for axis in range(self.domain.dim):
-            # Skip if not a parity axis
-            if "parity" not in LHS.meta[axis]:
-                continue
-            if RHS != 0:
-                if LHS.meta[axis]['parity'] != RHS.meta[axis]['parity']:
-                    raise SymbolicParsingError("LHS and RHS parities along axis {} do not match.".format(axis))
-
-    def _check_meta_envelope(self, LHS, RHS):
-        """Check that LHS envelope matches RHS envelope if RHS is nonzero."""
-        for axis in range(self.domain.dim):
-            # Skip if not an envelope axis
-            if "envelope" not in LHS.meta[axis]:
-                continue
-            if RHS != 0:
-                if LHS.meta[axis]['envelope'] != RHS.meta[axis]['envelope']:
-                    raise SymbolicParsingError("LHS and RHS envelopes along axis {} do not match.".format(axis))
+    def _check_meta_parity(self, LHS_parity, RHS_parity, axis):
+        """Check that LHS parity matches RHS parity."""
+        if LHS_parity != RHS_parity:
+            raise SymbolicParsingError("LHS and RHS parities along axis {} do not match.".format(axis))
+
+    def _check_meta_envelope(self, LHS_envelope, RHS_envelope, axis):
+        """Check that LHS envelope matches RHS envelope."""
+        if LHS_envelope != RHS_envelope:
+            raise SymbolicParsingError("LHS and RHS envelopes along axis {} do not match.".format(axis))
 
     def _find_max_param(self, params):
         """Finds the maximum value of the specified parameters"""
@@ -279,7 +365,7 @@ class ProblemBase:
 
     def _require_homogeneous(self, temp, key, vars):
         """Require expression to be homogeneous with some variables set to zero."""
-        expr = temp[key]
+        expr = getattr(temp, key)
         for var in vars:
             if expr != 0:
                 expr = expr.replace(var, 0)
@@ -288,13 +374,17 @@ class ProblemBase:
 
     def _require_independent(self, temp, key, vars):
         """Require expression to be independent of some variables."""
-        if temp[key].has(*vars):
+        if getattr(temp, key)._atom_ids.intersection(map(id, vars)):
             names = [var.name for var in vars]
             raise UnsupportedEquationError("{} must be independent of {}.".format(key, names))
 
     def _require_first_order(self, temp, key, vars):
         """Require expression to be zeroth or first order in some variables."""
-        order = temp[key].order(*vars)
+        expr = getattr(temp, key)
+        # Skip traversal if expression does not contain any of the variables
+        if not expr._atom_ids.intersection(map(id, vars)):
+            return 0
+        order = expr.order(*vars)
         if order > 1:
             names = [var.name for var in vars]
             raise UnsupportedEquationError("{} must be first-order in {}.".format(key, names))
@@ -368,13 +458,13 @@ class InitialValueProblem(ProblemBase):
 
     def _set_matrix_expressions(self, temp):
         """Set expressions for building solver."""
-        M, L = temp['LHS'].split(self._dt)
+        M, L = temp.LHS.split(self._dt)
         M = Operand.cast(M)
-        M = M.replace(self._dt, lambda x: x)
-        vars = [self.namespace[var] for var in self.variables]
-        temp['M'] = self._prep_linear_form(M, vars, name='M')
-        temp['L'] = self._prep_linear_form(L, vars, name='L')
-        temp['F'] = temp['RHS']
+        M = M.strip_operator(self._dt)
+        vars = self._var_objects
+        temp.M = self._prep_linear_form(M, vars, name='M')
+        temp.L = self._prep_linear_form(L, vars, name='L')
+        temp.F = temp.RHS
 
 
 class LinearBoundaryValueProblem(ProblemBase):
@@ -406,14 +496,14 @@ class LinearBoundaryValueProblem(ProblemBase):
 
     def _check_conditions(self, temp):
         """Check object-form conditions."""
-        vars = [self.namespace[var] for var in self.variables]
+        vars = self._var_objects
         self._require_independent(temp, 'RHS', vars)
 
     def _set_matrix_expressions(self, temp):
         """Set expressions for building solver."""
-        vars = [self.namespace[var] for var in self.variables]
-        temp['L'] = self._prep_linear_form(temp['LHS'], vars, name='L')
-        temp['F'] = temp['RHS']
+        vars = self._var_objects
+        temp.L = self._prep_linear_form(temp.LHS, vars, name='L')
+        temp.F = temp.RHS
 
 
 class NonlinearBoundaryValueProblem(ProblemBase):
@@ -445,43 +535,45 @@ class NonlinearBoundaryValueProblem(ProblemBase):
 
     solver_class = solvers.NonlinearBoundaryValueSolver
 
+    def __init__(self, domain, variables, **kw):
+        super().__init__(domain, variables, **kw)
+        # Perturbation names, in variable order
+        self._pert_names = tuple(sys.intern('δ'+var) for var in self.variables)
+
     @CachedAttribute
     def namespace_additions(self):
         """Build namespace for problem parsing."""
         additions = {}
         # Add variable perturbations
-        for var in self.variables:
-            pert = 'δ' + var
+        for var, pert in zip(self.variables, self._pert_names):
             additions[pert] = self.domain.new_field(name=pert)
             additions[pert].meta = self.meta[var]
             additions[pert].set_scales(1, keep_data=False)
         return additions
 
+    @CachedAttribute
+    def _pert_objects(self):
+        """Perturbation fields, in variable order."""
+        return [self.namespace_additions[pert] for pert in self._pert_names]
+
     def _check_conditions(self, temp):
         """Check object-form conditions."""
         pass
 
     def _set_matrix_expressions(self, temp):
         """Set expressions for building solver."""
-        ep = field.Scalar(name='__epsilon__')
-        vars = [self.namespace[var] for var in self.variables]
-        perts = [self.namespace['δ'+var] for var in self.variables]
+        vars = self._var_objects
+        perts = self._pert_objects
         # Build LHS operating on perturbations
-        L = temp['LHS']
+        L = temp.LHS
         for var, pert in zip(vars, perts):
             L = L.replace(var, pert)
-        # Build Frechet derivative of RHS
-        F = temp['RHS']
-        dF = 0
-        for var, pert in zip(vars, perts):
-            dFi = F.replace(var, var + ep*pert)
-            dFi = field.Operand.cast(dFi.sym_diff(ep))
-            dFi = dFi.replace(ep, 0)
-            dF += dFi
+        # Build Frechet derivative of RHS in a single pass over the tree
+        dF = field.Operand.cast(temp.RHS.frechet_differential(vars, perts))
         # Set expressions
-        temp['L'] = self._prep_linear_form(L, perts, name='L')
-        temp['dF'] = self._prep_linear_form(dF, perts, name='dF')
-        temp['F-L'] = temp['RHS'] - temp['LHS']
+        temp.L = self._prep_linear_form(L, perts, name='L')
+        temp.dF = self._prep_linear_form(dF, perts, name='dF')
+        temp.F_minus_L = temp.RHS - temp.LHS
 
 
 class EigenvalueProblem(ProblemBase):
@@ -531,7 +623,7 @@ class EigenvalueProblem(ProblemBase):
 
     def _check_conditions(self, temp):
         """Check object-form conditions."""
-        vars = [self.namespace[var] for var in self.variables]
+        vars = self._var_objects
         self._require_homogeneous(temp, 'RHS', vars)
         self._require_first_order(temp, 'LHS', [self._ev])
         self._require_first_order(temp, 'RHS', [self._ev])
@@ -540,20 +632,19 @@ class EigenvalueProblem(ProblemBase):
         """Set expressions for building solver."""
         # Add RHS linearization to LHS
         ep = field.Scalar(name='__epsilon__')
-        vars = [self.namespace[var] for var in self.variables]
-        dF = temp['RHS']
+        vars = self._var_objects
+        dF = temp.RHS
         for var in vars:
             dF = dF.replace(var, ep*var)
         dF = field.Operand.cast(dF.sym_diff(ep))
         dF = dF.replace(ep, 0)
-        temp['linearization'] = temp['LHS'] - dF
+        temp.linearization = temp.LHS - dF
         # Build matrices from linearization
-        M, L = temp['linearization'].split(self._ev)
+        M, L = temp.linearization.split(self._ev)
         M = Operand.cast(M)
         M = M.replace(self._ev, 1)
-        vars = [self.namespace[var] for var in self.variables]
-        temp['M'] = self._prep_linear_form(M, vars, name='M')
-        temp['L'] = self._prep_linear_form(L, vars, name='L')
+        temp.M = self._prep_linear_form(M, vars, name='M')
+        temp.L = self._prep_linear_form(L, vars, name='L')
 
 
 # Aliases
@@ -56,6 +56,8 @@ class EigenvalueSolver:
 
     def __init__(self, problem, matsolver=None):
         logger.debug('Beginning EVP instantiation')
+        # Parse pending equations
+        problem._finalize_equations()
         if matsolver is None:
             # Default to factorizer to speed up solves within the Arnoldi iteration
             matsolver = matsolvers[config['linear algebra']['MATRIX_FACTORIZER'].lower()]
@@ -179,6 +181,9 @@ class LinearBoundaryValueSolver:
 
         logger.debug('Beginning LBVP instantiation')
 
+        # Parse pending equations
+        problem._finalize_equations()
+
         if matsolver is None:
             # Default to factorizer to speed up repeated solves
             matsolver = matsolvers[config['linear algebra']['MATRIX_FACTORIZER'].lower()]
@@ -200,7 +205,7 @@ class LinearBoundaryValueSolver:
         self.evaluator = Evaluator(domain, namespace)
         F_handler = self.evaluator.add_system_handler(iter=1, group='F')
         for eqn in problem.eqs:
-            F_handler.add_task(eqn['F'])
+            F_handler.add_task(eqn.F)
         self.F = F_handler.build_system()
 
         logger.debug('Finished LBVP instantiation')
@@ -254,6 +259,9 @@ class NonlinearBoundaryValueSolver:
 
         logger.debug('Beginning NLBVP instantiation')
 
+        # Parse pending equations
+        problem._finalize_equations()
+
         if matsolver is None:
             # Default to solver since every iteration sees a new matrix
             matsolver = matsolvers[config['linear algebra']['MATRIX_SOLVER'].lower()]
@@ -269,7 +277,7 @@ class NonlinearBoundaryValueSolver:
         # Build systems
         namespace = problem.namespace
         vars = [namespace[var] for var in problem.variables]
-        perts = [namespace['δ'+var] for var in problem.variables]
+        perts = [namespace[pert] for pert in problem._pert_names]
         self.state = FieldSystem(vars)
         self.perturbations = FieldSystem(perts)
 
@@ -281,7 +289,7 @@ class NonlinearBoundaryValueSolver:
         self.evaluator = Evaluator(domain, namespace)
         F_handler = self.evaluator.add_system_handler(iter=1, group='F')
         for eqn in problem.eqs:
-            F_handler.add_task(eqn['F-L'])
+            F_handler.add_task(eqn.F_minus_L)
         self.F = F_handler.build_system()
 
         logger.debug('Finished NLBVP instantiation')
@@ -346,6 +354,9 @@ class InitialValueSolver:
 
         logger.debug('Beginning IVP instantiation')
 
+        # Parse pending equations
+        problem._finalize_equations()
+
         if matsolver is None:
             # Default to factorizer to speed up repeated solves
             matsolver = matsolvers[config['linear algebra']['MATRIX_FACTORIZER'].lower()]
@@ -370,7 +381,7 @@ class InitialValueSolver:
         self.evaluator = Evaluator(domain, namespace)
         F_handler = self.evaluator.add_system_handler(iter=1, group='F')
         for eqn in problem.eqs:
-            F_handler.add_task(eqn['F'])
+            F_handler.add_task(eqn.F)
         self.F = F_handler.build_system()
 
         # Initialize timestepper
@@ -70,3 +70,41 @@ def test_sin_nlbvp(benchmark, x_basis_class, Nx, dtype):
     u.set_scales(1)
     assert np.allclose(u['g'], u_true)
 
+
+@pytest.mark.parametrize('dtype', [np.float64, np.complex128])
+@pytest.mark.parametrize('Nx', [32])
+@pytest.mark.parametrize('x_basis_class', [de.Chebyshev, de.Legendre, DoubleChebyshev, DoubleLegendre])
+@bench_wrapper
+def test_coupled_nlbvp(benchmark, x_basis_class, Nx, dtype):
+    # Parameters
+    ncc_cutoff = 1e-10
+    tolerance = 1e-10
+    # Build domain
+    x_basis = x_basis_class('x', Nx, interval=(0, 1), dealias=2)
+    domain = de.Domain([x_basis], grid_dtype=dtype)
+    # Setup problem
+    problem = de.NLBVP(domain, variables=['u', 'v'], ncc_cutoff=ncc_cutoff)
+    problem.add_equation("dx(u) = v*(u**2 + v**2)")
+    problem.add_equation("dx(v) = -u*exp(u**2 + v**2 - 1)")
+    problem.add_bc("left(u) = 0")
+    problem.add_bc("left(v) = 1")
+    # Setup initial guess
+    solver = problem.build_solver()
+    x = domain.grid(0)
+    u = solver.state['u']
+    v = solver.state['v']
+    u['g'] = x
+    v['g'] = 1
+    # Iterations
+    pert = solver.perturbations.data
+    pert.fill(1+tolerance)
+    while np.sum(np.abs(pert)) > tolerance:
+        solver.newton_iteration()
+        logger.info('Perturbation norm: {}'.format(np.sum(np.abs(pert))))
+    # Check solution
+    u_true = np.sin(x)
+    v_true = np.cos(x)
+    u.set_scales(1)
+    v.set_scales(1)
+    assert np.allclose(u['g'], u_true)
+    assert np.allclose(v['g'], v_true)
@@ -57,3 +57,28 @@ def test_1d_output(x_basis_class, Nx, timestepper, dtype):
     u_true = amp * np.sin(x[None, :])
     assert np.allclose(ug, u_true)
 
+
+@pytest.mark.parametrize('dtype', [np.float64])
+@pytest.mark.parametrize('timestepper', [de.timesteppers.RK222])
+@pytest.mark.parametrize('Nx', [32])
+@pytest.mark.parametrize('x_basis_class', [de.Fourier])
+def test_padded_task(x_basis_class, Nx, timestepper, dtype):
+    # Bases and domain
+    x_basis = x_basis_class('x', Nx, interval=(0, 2*np.pi))
+    domain = de.Domain([x_basis], grid_dtype=dtype)
+    # Problem
+    problem = de.IVP(domain, variables=['u'])
+    problem.add_equation("dt(u) = 0")
+    # Solver
+    solver = problem.build_solver(timestepper)
+    x = domain.grid(0)
+    u = solver.state['u']
+    u['g'] = np.sin(x)
+    # Task with surrounding whitespace
+    handler = solver.evaluator.add_dictionary_handler(iter=1)
+    handler.add_task(" \t2*u ", name='u2')
+    u2 = handler.tasks[0]['operator'].evaluate()
+    # Check task
+    u2.set_scales(1)
+    assert np.allclose(u2['g'], 2*np.sin(x))
+
@@ -0,0 +1,228 @@
+"""
+Test problem namespace and equation handling.
+"""
+
+import re
+import pytest
+import numpy as np
+from dedalus import public as de
+from dedalus.tools.exceptions import SymbolicParsingError
+from dedalus.tools.exceptions import UnsupportedEquationError
+
+
+def build_line_problem(Nx, dtype):
+    # Bases and domain
+    x_basis = de.Chebyshev('x', Nx, interval=(0, 1))
+    domain = de.Domain([x_basis], grid_dtype=dtype)
+    # Problem
+    problem = de.LBVP(domain, variables=['u'])
+    return domain, problem
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.complex128])
+@pytest.mark.parametrize('Nx', [16])
+def test_add_parameter_after_build(Nx, dtype):
+    domain, problem = build_line_problem(Nx, dtype)
+    problem.add_parameter('a', 1)
+    problem.add_equation("dx(u) = a")
+    problem.add_bc("left(u) = 0")
+    solver = problem.build_solver()
+    # Replace parameter after namespace was built
+    problem.add_parameter('a', 2)
+    solver = problem.build_solver()
+    solver.solve()
+    # Check solution
+    x = domain.grid(0)
+    u_true = 2 * x
+    u = solver.state['u']
+    assert np.allclose(u['g'], u_true)
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.complex128])
+@pytest.mark.parametrize('Nx', [16])
+def test_add_substitution_after_build(Nx, dtype):
+    domain, problem = build_line_problem(Nx, dtype)
+    problem.add_parameter('a', 1)
+    problem.add_substitution('f', "a")
+    problem.add_equation("dx(u) = f")
+    problem.add_bc("left(u) = 0")
+    solver = problem.build_solver()
+    # Replace substitution after namespace was built
+    problem.add_substitution('f', "3*a")
+    solver = problem.build_solver()
+    solver.solve()
+    # Check solution
+    x = domain.grid(0)
+    u_true = 3 * x
+    u = solver.state['u']
+    assert np.allclose(u['g'], u_true)
+
+
+@pytest.mark.parametrize('name', ['u-x', '1a'])
+def test_invalid_variable_name(name):
+    x_basis = de.Chebyshev('x', 16, interval=(0, 1))
+    domain = de.Domain([x_basis], grid_dtype=np.float64)
+    problem = de.LBVP(domain, variables=[name])
+    with pytest.raises(SymbolicParsingError, match="not a valid identifier"):
+        problem.namespace
+
+
+@pytest.mark.parametrize('name', ['u-x', '1a'])
+def test_invalid_parameter_name(name):
+    domain, problem = build_line_problem(16, np.float64)
+    problem.parameters[name] = 1
+    with pytest.raises(SymbolicParsingError, match="not a valid identifier"):
+        problem.namespace
+
+
+def test_equation_error_from_build_solver(caplog):
+    # Unsupported equation
+    domain, problem = build_line_problem(16, np.float64)
+    problem.add_equation("dx(u) = u*u")
+    problem.add_bc("left(u) = 0")
+    with pytest.raises(UnsupportedEquationError, match=re.escape("Eqn 0 ('dx(u) = u*u')")):
+        problem.build_solver()
+    # Misspelled name
+    domain, problem = build_line_problem(16, np.float64)
+    problem.add_equation("dx(u) = 1")
+    problem.add_bc("left(uu) = 0")
+    with pytest.raises(NameError):
+        problem.build_solver()
+    assert "Failed to parse Eqn 1 ('left(uu) = 0')" in caplog.text
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.complex128])
+@pytest.mark.parametrize('Nx', [16])
+def test_build_solver_finalizes_new_equations(Nx, dtype):
+    domain, problem = build_line_problem(Nx, dtype)
+    problem.add_equation("dx(u) = 1")
+    problem.add_bc("left(u) = 0")
+    solver = problem.build_solver()
+    LHS = [eq.LHS for eq in problem.eqs]
+    # Add inactive equation after the first build
+    problem.add_bc("right(u) = 0", condition="False")
+    solver = problem.build_solver()
+    # Only the new equation should be parsed
+    assert all(eq.LHS is eq_LHS for eq, eq_LHS in zip(problem.eqs, LHS))
+    assert all(eq.finalized for eq in problem.eqs)
+    solver.solve()
+    # Check solution
+    x = domain.grid(0)
+    u_true = x
+    u = solver.state['u']
+    assert np.allclose(u['g'], u_true)
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.complex128])
+@pytest.mark.parametrize('Nx', [16])
+def test_substitution_changes_tau(Nx, dtype):
+    domain, problem = build_line_problem(Nx, dtype)
+    problem.add_substitution('f', "u")
+    problem.add_equation("f = 1")
+    solver = problem.build_solver()
+    assert problem.eqs[0].tau == 0
+    # Make equation differential after the first build
+    problem.add_substitution('f', "dx(u)")
+    problem.add_bc("left(u) = 0")
+    solver = problem.build_solver()
+    assert problem.eqs[0].differential == 1
+    assert problem.eqs[0].tau == 1
+    solver.solve()
+    # Check solution
+    x = domain.grid(0)
+    u_true = x
+    u = solver.state['u']
+    assert np.allclose(u['g'], u_true)
+
+
+def test_duplicate_basis_names():
+    x_basis = de.Chebyshev('x', 16, interval=(0, 1))
+    sx_basis = de.Fourier('sx', 16, interval=(0, 1))
+    domain = de.Domain([sx_basis, x_basis], grid_dtype=np.float64)
+    problem = de.LBVP(domain, variables=['u'])
+    with pytest.raises(SymbolicParsingError, match="used multiple times"):
+        problem.namespace
+
+
+def test_invalid_basis_name():
+    x_basis = de.Chebyshev('x-1', 16, interval=(0, 1))
+    domain = de.Domain([x_basis], grid_dtype=np.float64)
+    problem = de.LBVP(domain, variables=['u'])
+    with pytest.raises(SymbolicParsingError, match="not a valid identifier"):
+        problem.namespace
+
+
+def test_invalid_time_name():
+    x_basis = de.Chebyshev('x', 16, interval=(0, 1))
+    domain = de.Domain([x_basis], grid_dtype=np.float64)
+    problem = de.IVP(domain, variables=['u'], time='t-1')
+    with pytest.raises(SymbolicParsingError, match="not a valid identifier"):
+        problem.namespace
+
+
+def build_periodic_ivp():
+    # Bases and domain
+    x_basis = de.Fourier('x', 16, interval=(0, 2*np.pi))
+    domain = de.Domain([x_basis], grid_dtype=np.float64)
+    # Problem
+    problem = de.IVP(domain, variables=['u'])
+    return domain, problem
+
+
+def test_ivp_dt_on_RHS():
+    domain, problem = build_periodic_ivp()
+    problem.add_equation("dt(u) = u*dt(u)")
+    with pytest.raises(UnsupportedEquationError, match="RHS must be independent"):
+        problem.build_solver(de.timesteppers.RK222)
+
+
+def test_ivp_time_on_LHS():
+    domain, problem = build_periodic_ivp()
+    problem.add_equation("dt(u) + t*u = 0")
+    with pytest.raises(UnsupportedEquationError, match="LHS must be independent"):
+        problem.build_solver(de.timesteppers.RK222)
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.complex128])
+@pytest.mark.parametrize('Nx', [16])
+def test_padded_substitution(Nx, dtype):
+    domain, problem = build_line_problem(Nx, dtype)
+    problem.add_parameter('a', 2)
+    problem.add_substitution('f', " \t2*a ")
+    problem.add_equation("dx(u) = f")
+    problem.add_bc("left(u) = 0")
+    solver = problem.build_solver()
+    solver.solve()
+    # Check solution
+    x = domain.grid(0)
+    u_true = 4 * x
+    u = solver.state['u']
+    assert np.allclose(u['g'], u_true)
+
+
+def test_second_order_coupled_derivative():
+    domain, problem = build_line_problem(16, np.float64)
+    problem.add_equation("dx(dx(u)) = 1")
+    with pytest.raises(UnsupportedEquationError, match="LHS must be first-order"):
+        problem.build_solver()
+
+
+def test_second_order_time_derivative():
+    domain, problem = build_periodic_ivp()
+    problem.add_equation("dt(dt(u)) = 0")
+    with pytest.raises(UnsupportedEquationError, match="LHS must be first-order"):
+        problem.build_solver(de.timesteppers.RK222)
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.complex128])
+@pytest.mark.parametrize('Nx', [16])
+def test_zeroth_order_equation(Nx, dtype):
+    domain, problem = build_line_problem(Nx, dtype)
+    problem.add_equation("u = 1")
+    solver = problem.build_solver()
+    assert problem.eqs[0].differential == 0
+    assert problem.eqs[0].tau == 0
+    solver.solve()
+    # Check solution
+    u = solver.state['u']
+    assert np.allclose(u['g'], 1)
@@ -2,6 +2,7 @@
 
 import re
 
+from .cache import CachedFunction
 from .exceptions import SymbolicParsingError
 
 
@@ -82,3 +83,18 @@ def lambdify_functions(call, result):
         return call, result
 
 
+@CachedFunction(max_size=1024)
+def compile_expression(string):
+    """
+    Compile expression string to a code object for repeated evaluation.
+
+    Examples
+    --------
+    >>> eval(compile_expression('a*b'), {'a': 2, 'b': 3})
+    6
+    >>> eval(compile_expression(' a*b '), {'a': 2, 'b': 3})
+    6
+
+    """
+    # Strip surrounding whitespace, as eval does for strings
+    return compile(string.strip(), '<string>', 'eval')